@@ -1,29 +1,62 @@
 """API endpoints for eclipse calculations."""
 
-from datetime import datetime, timedelta, timezone
+import functools
+from datetime import UTC, datetime, timedelta
 
+import numpy as np
+import numpy.typing as npt
 from fastapi import APIRouter, HTTPException
 
 from app.models import (
     CircularEclipseRequest,
     CircularEclipseResponse,
-    EclipseSample,
-    EclipseSummary,
     YearlyEclipseRequest,
     YearlyEclipseResponse,
 )
+from app.orbit import _kernels
 from app.orbit.eclipse import (
+    DEG2RAD,
+    EARTH_MU,
+    EARTH_RADIUS_KM,
+    RAD2DEG,
     compute_beta_critical_deg,
     compute_eclipse_duration_sec,
     compute_mean_motion,
-    compute_orbital_period_sec,
     compute_orbit_radius_km,
+    compute_orbital_period_sec,
+    make_eclipse_fn,
 )
-from app.orbit.sun import compute_beta_angle_deg, compute_orbit_normal_eci
+from app.orbit.sun import compute_beta_angles_rad, compute_orbit_normal_eci
+from app.orbit.time import datetime_to_julian_day_fast, format_utc_timestamps
+from app.responses import ORJSONResponse
 
 router = APIRouter(prefix="/api/eclipse", tags=["eclipse"])
 
 
+@functools.lru_cache(maxsize=4096)
+def _orbit_constants(altitude_km: float) -> tuple[float, float, float, float]:
+    """Return (orbit radius km, mean motion rad/s, period s, beta_crit deg) for an altitude."""
+    r_km = compute_orbit_radius_km(altitude_km)
+    n_rad_s = compute_mean_motion(r_km)
+    period_sec = compute_orbital_period_sec(n_rad_s)
+    beta_crit_deg = compute_beta_critical_deg(r_km)
+    return r_km, n_rad_s, period_sec, beta_crit_deg
+
+
+def _run_yearly_kernel(
+    jd: npt.NDArray[np.float64], h_hat: tuple[float, float, float], r_km: float
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Compute beta angles (radians) and eclipse durations (seconds) for each Julian day."""
+    if _kernels.RUST_CORE_ENABLED:
+        return _kernels.rust_yearly_kernel(jd, *h_hat, r_km, EARTH_RADIUS_KM, EARTH_MU)
+
+    if _kernels.NUMBA_AVAILABLE:
+        return _kernels.numba_yearly_kernel(jd, *h_hat, r_km, EARTH_RADIUS_KM, EARTH_MU)
+
+    beta_rad = compute_beta_angles_rad(jd, h_hat)
+    return beta_rad, make_eclipse_fn(r_km)(beta_rad)
+
+
 @router.post("/circular", response_model=CircularEclipseResponse)
 async def compute_circular_eclipse(request: CircularEclipseRequest) -> CircularEclipseResponse:
     """
@@ -38,12 +71,9 @@ async def compute_circular_eclipse(request: CircularEclipseRequest) -> CircularE
     if not -90 <= request.beta_deg <= 90:
         raise HTTPException(status_code=400, detail="Beta angle must be between -90 and 90 degrees")
     
-    r_km = compute_orbit_radius_km(request.altitude_km)
-    n_rad_s = compute_mean_motion(r_km)
-    period_sec = compute_orbital_period_sec(n_rad_s)
-    beta_crit_deg = compute_beta_critical_deg(r_km)
+    r_km, _, period_sec, beta_crit_deg = _orbit_constants(request.altitude_km)
     
-    eclipse_sec = compute_eclipse_duration_sec(r_km, request.beta_deg)
+    eclipse_sec = compute_eclipse_duration_sec(r_km, request.beta_deg * DEG2RAD)
     
     return CircularEclipseResponse(
         altitude_km=request.altitude_km,
@@ -57,8 +87,10 @@ async def compute_circular_eclipse(request: CircularEclipseRequest) -> CircularE
     )
 
 
+# A plain def so FastAPI runs it in its threadpool: the kernel, timestamp formatting and
+# JSON rendering of large responses all stay off the event loop
 @router.post("/yearly", response_model=YearlyEclipseResponse)
-async def compute_yearly_eclipse(request: YearlyEclipseRequest) -> YearlyEclipseResponse:
+def compute_yearly_eclipse(request: YearlyEclipseRequest) -> ORJSONResponse:
     """
     Compute eclipse duration over a year based on orbital parameters.
     
@@ -90,84 +122,65 @@ async def compute_yearly_eclipse(request: YearlyEclipseRequest) -> YearlyEclipse
     try:
         start_dt = datetime.fromisoformat(request.start_utc.replace("Z", "+00:00"))
         if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=timezone.utc)
+            start_dt = start_dt.replace(tzinfo=UTC)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid start_utc format: {e}")
     
     # Compute orbital parameters
-    r_km = compute_orbit_radius_km(request.altitude_km)
-    n_rad_s = compute_mean_motion(r_km)
-    period_sec = compute_orbital_period_sec(n_rad_s)
-    beta_crit_deg = compute_beta_critical_deg(r_km)
+    r_km, _, period_sec, beta_crit_deg = _orbit_constants(request.altitude_km)
     
     # Compute orbit normal vector (fixed for this simulation - no RAAN precession)
     h_hat = compute_orbit_normal_eci(request.inclination_deg, request.raan_deg)
     
-    # Generate samples
-    samples: list[EclipseSample] = []
+    # Evaluate all sample epochs at once
     step_delta = timedelta(hours=request.step_hours)
     total_steps = int(request.days * 24 / request.step_hours)
     
-    max_eclipse_min = 0.0
-    min_eclipse_min = float("inf")
-    days_with_eclipse = 0
-    current_day = -1
-    day_has_eclipse = False
-    
-    current_time = start_dt
-    for _ in range(total_steps + 1):
-        beta_deg = compute_beta_angle_deg(current_time, h_hat)
-        eclipse_sec = compute_eclipse_duration_sec(r_km, beta_deg)
-        eclipse_min = eclipse_sec / 60.0
-        
-        samples.append(
-            EclipseSample(
-                t_utc=current_time.isoformat().replace("+00:00", "Z"),
-                beta_deg=round(beta_deg, 4),
-                eclipse_min=round(eclipse_min, 4),
-            )
-        )
-        
-        # Track statistics
-        if eclipse_min > max_eclipse_min:
-            max_eclipse_min = eclipse_min
-        if eclipse_min > 0 and eclipse_min < min_eclipse_min:
-            min_eclipse_min = eclipse_min
-        
-        # Track days with eclipse
-        day_of_sim = (current_time - start_dt).days
-        if day_of_sim != current_day:
-            if day_has_eclipse:
-                days_with_eclipse += 1
-            current_day = day_of_sim
-            day_has_eclipse = False
-        if eclipse_min > 0:
-            day_has_eclipse = True
-        
-        current_time += step_delta
-    
-    # Handle last day
-    if day_has_eclipse:
-        days_with_eclipse += 1
-    
-    # Handle case where there's no eclipse at all
-    if min_eclipse_min == float("inf"):
-        min_eclipse_min = 0.0
-    
-    summary = EclipseSummary(
-        max_eclipse_min=round(max_eclipse_min, 4),
-        min_eclipse_min=round(min_eclipse_min, 4),
-        days_with_eclipse=days_with_eclipse,
-    )
-    
-    return YearlyEclipseResponse(
-        altitude_km=request.altitude_km,
-        inclination_deg=request.inclination_deg,
-        raan_deg=request.raan_deg,
-        orbit_radius_km=r_km,
-        period_sec=period_sec,
-        period_min=round(period_sec / 60.0, 4),
-        beta_crit_deg=round(beta_crit_deg, 4),
-        samples=samples,
-        summary=summary,
+    jd0 = datetime_to_julian_day_fast(start_dt)
+    jd = jd0 + (request.step_hours / 24.0) * np.arange(total_steps + 1, dtype=np.float64)
+
+    beta_rad_arr, eclipse_sec_arr = _run_yearly_kernel(jd, h_hat, r_km)
+
+    eclipse_min_arr = eclipse_sec_arr / 60.0
+
+    # Summary statistics
+    has_eclipse = eclipse_min_arr > 0
+    max_eclipse_min = float(eclipse_min_arr.max())
+    min_eclipse_min = float(eclipse_min_arr[has_eclipse].min()) if has_eclipse.any() else 0.0
+
+    # Whole days since start for each sample, in exact integer microseconds
+    step_us = step_delta // timedelta(microseconds=1)
+    day_of_sim = (np.arange(total_steps + 1, dtype=np.int64) * step_us) // 86_400_000_000
+    days_with_eclipse = int(np.unique(day_of_sim[has_eclipse]).size)
+
+    # Sample columns, kept as parallel arrays until the response rows are built
+    t_utc = format_utc_timestamps(start_dt, step_delta, total_steps + 1)
+    beta_deg = np.round(beta_rad_arr * RAD2DEG, 4)
+    eclipse_min = np.round(eclipse_min_arr, 4)
+
+    # The response is built directly rather than through YearlyEclipseResponse so that
+    # thousands of samples skip pydantic validation and serialization
+    samples = [
+        {"t_utc": t, "beta_deg": b, "eclipse_min": e}
+        for t, b, e in zip(t_utc, beta_deg.tolist(), eclipse_min.tolist())
+    ]
+
+    summary = {
+        "max_eclipse_min": round(max_eclipse_min, 4),
+        "min_eclipse_min": round(min_eclipse_min, 4),
+        "days_with_eclipse": days_with_eclipse,
+    }
+
+    return ORJSONResponse(
+        content={
+            "altitude_km": request.altitude_km,
+            "inclination_deg": request.inclination_deg,
+            "raan_deg": request.raan_deg,
+            "orbit_radius_km": r_km,
+            "period_sec": period_sec,
+            "period_min": round(period_sec / 60.0, 4),
+            "beta_crit_deg": round(beta_crit_deg, 4),
+            "samples": samples,
+            "summary": summary,
+        }
     )
@@ -1,29 +1,108 @@
 """FastAPI application entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api import router
+from app.orbit._kernels import warm_up_kernels
+from app.responses import ORJSONResponse
 
 # CORS configuration for frontend development
 CORS_ORIGINS = [
     "http://localhost:5173",
     "http://127.0.0.1:5173",
 ]
+CORS_ALLOW_METHODS = ["POST", "GET", "OPTIONS"]
+CORS_ALLOW_HEADERS = ["Content-Type"]
+
+_CORS_ORIGINS = frozenset(origin.encode("latin-1") for origin in CORS_ORIGINS)
+# Sent for every request carrying an Origin, allowed or not, since the CORS headers
+# depend on it and shared caches must not reuse one origin's response for another
+_CORS_VARY_HEADER = (b"vary", b"Origin")
+_CORS_RESPONSE_HEADERS = [
+    (b"access-control-allow-credentials", b"true"),
+    _CORS_VARY_HEADER,
+]
+_CORS_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", ", ".join(CORS_ALLOW_METHODS).encode("latin-1")),
+    (b"access-control-allow-headers", ", ".join(CORS_ALLOW_HEADERS).encode("latin-1")),
+    (b"access-control-max-age", b"600"),
+]
+
+
+class FixedOriginCORSMiddleware:
+    """
+    CORS middleware for a fixed set of origins.
+
+    Answers preflight requests directly with constant headers and adds the
+    allow-origin headers to other responses from a known origin. Responses to
+    other origins only get Vary: Origin; requests without an Origin pass
+    through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        is_preflight = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                is_preflight = True
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if origin not in _CORS_ORIGINS:
+            cors_headers = [_CORS_VARY_HEADER]
+        else:
+            cors_headers = [(b"access-control-allow-origin", origin), *_CORS_RESPONSE_HEADERS]
+
+        if is_preflight and scope["method"] == "OPTIONS" and origin in _CORS_ORIGINS:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 204,
+                    "headers": cors_headers + _CORS_PREFLIGHT_HEADERS,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Compile optional JIT kernels at startup so the first request doesn't pay for it."""
+    warm_up_kernels()
+    yield
+
 
 app = FastAPI(
     title="Orbit Eclipse Calculator",
     description="Compute orbital eclipse durations for circular Earth orbits",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(FixedOriginCORSMiddleware)
 
 app.include_router(router)
 
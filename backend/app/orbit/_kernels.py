@@ -0,0 +1,225 @@
+"""Compiled kernels for the yearly eclipse calculation."""
+
+import math
+import os
+import threading
+
+import numpy as np
+import numpy.typing as npt
+
+from app.orbit.eclipse import DEG2RAD
+
+# Kernels are launched from worker threads, and the TBB threading layer hangs the
+# interpreter at exit when its first parallel launch is off the main thread. Prefer
+# OpenMP unless a layer was chosen through the environment; numba reads this on import.
+if not {"NUMBA_THREADING_LAYER", "NUMBA_THREADING_LAYER_PRIORITY"} & os.environ.keys():
+    os.environ["NUMBA_THREADING_LAYER_PRIORITY"] = "omp tbb workqueue"
+
+# numba is optional; without it callers fall back to the NumPy implementations
+try:
+    import numba
+    from numba import njit, prange
+except ImportError:
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
+# The prebuilt Rust kernel (backend/core) is optional as well
+try:
+    import sat_orbit_eclipse_core
+except ImportError:
+    RUST_CORE_AVAILABLE = False
+else:
+    RUST_CORE_AVAILABLE = True
+
+# The Rust kernel is only dispatched to when explicitly enabled, after checking
+# tests/test_kernels.py against the installed build
+RUST_CORE_ENABLED = RUST_CORE_AVAILABLE and os.environ.get("ORBIT_ECLIPSE_RUST_CORE") == "1"
+
+# Below this many samples, thread start-up costs more than the parallel loop saves
+PARALLEL_MIN_SAMPLES = 200
+
+# The workqueue threading layer, numba's fallback when neither OpenMP nor TBB is
+# available, must not run parallel kernels from two threads at once
+_workqueue_lock = threading.Lock()
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def _sample(
+        jd: float,
+        hx: float,
+        hy: float,
+        hz: float,
+        r_km: float,
+        h: float,
+        n: float,
+        sin_beta_crit: float,
+    ) -> tuple[float, float]:
+        """Beta angle (radians) and eclipse duration (seconds) at one Julian day."""
+        # Sun unit vector (see compute_sun_vector_eci)
+        t = (jd - 2451545.0) / 36525.0
+        l0 = (280.46646 + 36000.76983 * t + 0.0003032 * t * t) % 360.0
+        m = (357.52911 + 35999.05029 * t - 0.0001537 * t * t) % 360.0
+        m_rad = m * DEG2RAD
+
+        sin_m = math.sin(m_rad)
+        cos_m = math.cos(m_rad)
+        sin_2m = 2.0 * sin_m * cos_m
+        sin_3m = sin_m * (3.0 - 4.0 * sin_m * sin_m)
+        c = (1.914602 - 0.004817 * t - 0.000014 * t * t) * sin_m
+        c += (0.019993 - 0.000101 * t) * sin_2m
+        c += 0.000289 * sin_3m
+
+        sun_lon_rad = (l0 + c) * DEG2RAD
+        epsilon_rad = (
+            23.439291 - 0.0130042 * t - 1.64e-7 * t * t + 5.04e-7 * t * t * t
+        ) * DEG2RAD
+
+        sin_lon = math.sin(sun_lon_rad)
+        x = math.cos(sun_lon_rad)
+        y = sin_lon * math.cos(epsilon_rad)
+        z = sin_lon * math.sin(epsilon_rad)
+
+        # Beta angle
+        dot = max(-1.0, min(1.0, x * hx + y * hy + z * hz))
+        beta = math.asin(dot)
+
+        # Eclipse duration (see make_eclipse_fn). dot = sin(beta), so the
+        # beta_crit test and cos(beta) need no further trig calls
+        if abs(dot) >= sin_beta_crit:
+            return beta, 0.0
+
+        cos_theta_e = h / (r_km * math.sqrt(1.0 - dot * dot))
+        return beta, 2.0 * math.acos(min(1.0, cos_theta_e)) / n
+
+    @njit(cache=True, fastmath=True, nogil=True, parallel=True)
+    def yearly_kernel(
+        jd: npt.NDArray[np.float64],
+        hx: float,
+        hy: float,
+        hz: float,
+        r_km: float,
+        re_km: float,
+        mu: float,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Compute beta angles and eclipse durations for an array of Julian days.
+
+        Fuses compute_beta_angles_rad and make_eclipse_fn into a single
+        parallel loop over the samples, run with the GIL released.
+
+        Args:
+            jd: Array of Julian Day Numbers, shape (N,)
+            hx, hy, hz: Orbit normal unit vector components in ECI frame
+            r_km: Orbital radius in kilometers
+            re_km: Earth radius in kilometers
+            mu: Earth gravitational parameter in km^3/s^2
+
+        Returns:
+            Tuple of (beta angles in radians, eclipse durations in seconds)
+        """
+        n_samples = jd.shape[0]
+        beta_rad = np.empty(n_samples)
+        eclipse_sec = np.empty(n_samples)
+
+        h = math.sqrt(r_km * r_km - re_km * re_km)
+        n = math.sqrt(mu / (r_km**3))
+        sin_beta_crit = re_km / r_km
+
+        for i in prange(n_samples):
+            beta_rad[i], eclipse_sec[i] = _sample(jd[i], hx, hy, hz, r_km, h, n, sin_beta_crit)
+
+        return beta_rad, eclipse_sec
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def yearly_kernel_serial(
+        jd: npt.NDArray[np.float64],
+        hx: float,
+        hy: float,
+        hz: float,
+        r_km: float,
+        re_km: float,
+        mu: float,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Single-threaded yearly_kernel for batches too small to parallelise."""
+        n_samples = jd.shape[0]
+        beta_rad = np.empty(n_samples)
+        eclipse_sec = np.empty(n_samples)
+
+        h = math.sqrt(r_km * r_km - re_km * re_km)
+        n = math.sqrt(mu / (r_km**3))
+        sin_beta_crit = re_km / r_km
+
+        for i in range(n_samples):
+            beta_rad[i], eclipse_sec[i] = _sample(jd[i], hx, hy, hz, r_km, h, n, sin_beta_crit)
+
+        return beta_rad, eclipse_sec
+
+
+def numba_yearly_kernel(
+    jd: npt.NDArray[np.float64],
+    hx: float,
+    hy: float,
+    hz: float,
+    r_km: float,
+    re_km: float,
+    mu: float,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Compute beta angles and eclipse durations with the numba kernels.
+
+    Runs yearly_kernel_serial below PARALLEL_MIN_SAMPLES samples and
+    yearly_kernel otherwise. Only valid when NUMBA_AVAILABLE is True.
+    """
+    if jd.shape[0] < PARALLEL_MIN_SAMPLES:
+        beta_rad, eclipse_sec = yearly_kernel_serial(jd, hx, hy, hz, r_km, re_km, mu)
+        return beta_rad, eclipse_sec
+
+    if _threading_layer_is_threadsafe():
+        beta_rad, eclipse_sec = yearly_kernel(jd, hx, hy, hz, r_km, re_km, mu)
+        return beta_rad, eclipse_sec
+
+    with _workqueue_lock:
+        beta_rad, eclipse_sec = yearly_kernel(jd, hx, hy, hz, r_km, re_km, mu)
+    return beta_rad, eclipse_sec
+
+
+def _threading_layer_is_threadsafe() -> bool:
+    """Whether parallel kernels may be launched from several threads at once."""
+    try:
+        return bool(numba.threading_layer() != "workqueue")
+    except ValueError:
+        # No layer is selected until the first parallel launch
+        return False
+
+
+def rust_yearly_kernel(
+    jd: npt.NDArray[np.float64],
+    hx: float,
+    hy: float,
+    hz: float,
+    r_km: float,
+    re_km: float,
+    mu: float,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Compute beta angles and eclipse durations with the Rust kernel.
+
+    Same arguments and results as yearly_kernel. Only valid when
+    RUST_CORE_AVAILABLE is True.
+    """
+    beta_rad, eclipse_sec = sat_orbit_eclipse_core.yearly_kernel(
+        jd, hx, hy, hz, r_km, re_km, mu
+    )
+    return beta_rad, eclipse_sec
+
+
+def warm_up_kernels() -> None:
+    """Compile (or load from cache) the numba kernels ahead of the first request."""
+    if not NUMBA_AVAILABLE:
+        return
+
+    jd = np.array([2451545.0])
+    yearly_kernel(jd, 0.0, 0.0, 1.0, 6771.0, 6371.0, 398600.4418)
+    yearly_kernel_serial(jd, 0.0, 0.0, 1.0, 6771.0, 6371.0, 398600.4418)
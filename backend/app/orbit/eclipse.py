@@ -1,11 +1,19 @@
 """Eclipse duration calculations for circular orbits."""
 
 import math
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
 
 # Earth constants
 EARTH_RADIUS_KM = 6371.0  # Mean Earth radius in kilometers
 EARTH_MU = 398600.4418  # Earth gravitational parameter in km^3/s^2
 
+# Angle conversion factors
+DEG2RAD = math.pi / 180.0
+RAD2DEG = 180.0 / math.pi
+
 
 def compute_orbit_radius_km(altitude_km: float) -> float:
     """
@@ -39,7 +47,7 @@ def compute_orbital_period_sec(mean_motion: float) -> float:
     """
     Compute orbital period from mean motion.
     
-    T = 2*pi / n
+    T = tau / n  (tau = 2*pi)
     
     Args:
         mean_motion: Mean motion in radians per second
@@ -47,7 +55,7 @@ def compute_orbital_period_sec(mean_motion: float) -> float:
     Returns:
         Orbital period in seconds
     """
-    return 2.0 * math.pi / mean_motion
+    return math.tau / mean_motion
 
 
 def compute_beta_critical_deg(radius_km: float) -> float:
@@ -67,10 +75,10 @@ def compute_beta_critical_deg(radius_km: float) -> float:
     sin_beta_crit = EARTH_RADIUS_KM / radius_km
     # Clamp to valid range for asin
     sin_beta_crit = max(-1.0, min(1.0, sin_beta_crit))
-    return math.degrees(math.asin(sin_beta_crit))
+    return math.asin(sin_beta_crit) * RAD2DEG
 
 
-def compute_eclipse_duration_sec(radius_km: float, beta_deg: float) -> float:
+def compute_eclipse_duration_sec(radius_km: float, beta_rad: float) -> float:
     """
     Compute eclipse duration per orbit using cylindrical shadow approximation.
     
@@ -79,48 +87,58 @@ def compute_eclipse_duration_sec(radius_km: float, beta_deg: float) -> float:
     
     Args:
         radius_km: Orbital radius in kilometers
-        beta_deg: Beta angle in degrees
+        beta_rad: Beta angle in radians
         
     Returns:
         Eclipse duration in seconds (0 if no eclipse)
     """
-    # Check if eclipse occurs
-    beta_crit_deg = compute_beta_critical_deg(radius_km)
-    if abs(beta_deg) >= beta_crit_deg:
-        return 0.0
-    
-    # Convert to radians
-    beta_rad = math.radians(beta_deg)
-    
-    # Compute eclipse geometry
     r = radius_km
     re = EARTH_RADIUS_KM
-    
-    cos_beta = math.cos(beta_rad)
-    
-    # Avoid division by zero when cos(beta) is very small
-    if abs(cos_beta) < 1e-10:
-        return 0.0
-    
+
     # Height of orbital plane above Earth center projected along Sun vector
     h = math.sqrt(r * r - re * re)
-    
-    # Eclipse half-angle
-    cos_theta_e = h / (r * cos_beta)
-    
-    # Clamp to valid range for acos
-    if cos_theta_e >= 1.0:
+    r_cos_beta = r * math.cos(beta_rad)
+
+    # |beta| >= beta_crit is exactly r * cos(beta) <= h: no eclipse
+    if r_cos_beta <= h:
         return 0.0
-    if cos_theta_e <= -1.0:
-        # Full orbit in shadow (shouldn't happen for reasonable orbits)
-        theta_e = math.pi
-    else:
-        theta_e = math.acos(cos_theta_e)
+
+    # Eclipse half-angle and duration
+    theta_e = math.acos(h / r_cos_beta)
+
+    return 2.0 * theta_e / compute_mean_motion(radius_km)
+
+
+def make_eclipse_fn(
+    radius_km: float,
+) -> Callable[[npt.NDArray[np.float64]], npt.NDArray[np.float64]]:
+    """
+    Build an eclipse duration function for a fixed orbit radius.
+    
+    The radius-dependent terms (shadow geometry and mean motion) are computed
+    once here instead of for every beta angle.
     
-    # Mean motion
+    Args:
+        radius_km: Orbital radius in kilometers
+
+    Returns:
+        Function mapping an array of beta angles in radians to eclipse
+        durations in seconds (0 where no eclipse)
+    """
+    r = radius_km
+    re = EARTH_RADIUS_KM
+    h = math.sqrt(r * r - re * re)
     n = compute_mean_motion(radius_km)
     
-    # Eclipse duration
-    eclipse_duration_sec = 2.0 * theta_e / n
+    def eclipse_duration_sec(beta_rad: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        # Only |beta| < beta_crit, i.e. r * cos(beta) > h, enters the shadow; high-beta
+        # stretches stay zero and the arccos runs on the remaining samples alone
+        r_cos_beta = r * np.cos(beta_rad)
+        eclipses_possible = r_cos_beta > h
+
+        eclipse_sec = np.zeros_like(r_cos_beta)
+        eclipse_sec[eclipses_possible] = 2.0 * np.arccos(h / r_cos_beta[eclipses_possible]) / n
+
+        return eclipse_sec
     
     return eclipse_duration_sec
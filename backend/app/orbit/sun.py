@@ -1,10 +1,18 @@
 """Sun position and beta angle calculations."""
 
+import functools
 import math
 from datetime import datetime
 
+import numpy as np
+import numpy.typing as npt
+
+from app.orbit.eclipse import DEG2RAD
 from app.orbit.time import datetime_to_julian_day
 
+# Decimal places kept when caching orbit normals (1e-6 deg is far below model accuracy)
+_ORBIT_NORMAL_CACHE_DECIMALS = 6
+
 
 def compute_sun_vector_eci(dt: datetime) -> tuple[float, float, float]:
     """
@@ -32,20 +40,25 @@ def compute_sun_vector_eci(dt: datetime) -> tuple[float, float, float]:
     # Mean anomaly of the Sun (degrees)
     m = 357.52911 + 35999.05029 * t - 0.0001537 * t * t
     m = m % 360.0
-    m_rad = math.radians(m)
-    
-    # Equation of center (degrees)
-    c = (1.914602 - 0.004817 * t - 0.000014 * t * t) * math.sin(m_rad)
-    c += (0.019993 - 0.000101 * t) * math.sin(2 * m_rad)
-    c += 0.000289 * math.sin(3 * m_rad)
+    m_rad = m * DEG2RAD
+
+    # Equation of center (degrees), using sin(2m) = 2 sin(m) cos(m)
+    # and sin(3m) = 3 sin(m) - 4 sin^3(m) to avoid two extra sin calls
+    sin_m = math.sin(m_rad)
+    cos_m = math.cos(m_rad)
+    sin_2m = 2.0 * sin_m * cos_m
+    sin_3m = sin_m * (3.0 - 4.0 * sin_m * sin_m)
+    c = (1.914602 - 0.004817 * t - 0.000014 * t * t) * sin_m
+    c += (0.019993 - 0.000101 * t) * sin_2m
+    c += 0.000289 * sin_3m
     
     # Sun's true longitude (degrees)
     sun_lon = l0 + c
-    sun_lon_rad = math.radians(sun_lon)
+    sun_lon_rad = sun_lon * DEG2RAD
     
     # Obliquity of the ecliptic (degrees)
     epsilon = 23.439291 - 0.0130042 * t - 1.64e-7 * t * t + 5.04e-7 * t * t * t
-    epsilon_rad = math.radians(epsilon)
+    epsilon_rad = epsilon * DEG2RAD
     
     # Sun position in ecliptic coordinates (assuming circular orbit, distance = 1)
     # Then convert to equatorial (ECI) coordinates
@@ -56,15 +69,59 @@ def compute_sun_vector_eci(dt: datetime) -> tuple[float, float, float]:
     cos_eps = math.cos(epsilon_rad)
     sin_eps = math.sin(epsilon_rad)
     
-    # ECI unit vector components
+    # ECI unit vector components; cos^2(lon) + sin^2(lon) * (cos^2(eps) + sin^2(eps)) = 1,
+    # so the vector is unit length by construction and needs no normalization
     x = cos_lon
     y = sin_lon * cos_eps
     z = sin_lon * sin_eps
     
-    # Normalize (should already be close to 1)
-    mag = math.sqrt(x * x + y * y + z * z)
+    return (x, y, z)
+
+
+def compute_sun_vectors_eci(jd: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Compute approximate Sun unit vectors in ECI frame for an array of Julian days.
+
+    Vectorized form of compute_sun_vector_eci, evaluating every epoch in a
+    single pass of NumPy operations.
+
+    Args:
+        jd: Array of Julian Day Numbers, shape (N,)
+
+    Returns:
+        Array of (x, y, z) unit vector components in ECI frame, shape (N, 3)
+    """
+    # Julian centuries from J2000.0
+    t = (jd - 2451545.0) / 36525.0
+
+    # Mean longitude of the Sun (degrees)
+    l0 = (280.46646 + 36000.76983 * t + 0.0003032 * t * t) % 360.0
     
-    return (x / mag, y / mag, z / mag)
+    # Mean anomaly of the Sun (degrees)
+    m = (357.52911 + 35999.05029 * t - 0.0001537 * t * t) % 360.0
+    m_rad = m * DEG2RAD
+
+    # Equation of center (degrees), with the same multiple-angle identities
+    sin_m = np.sin(m_rad)
+    cos_m = np.cos(m_rad)
+    sin_2m = 2.0 * sin_m * cos_m
+    sin_3m = sin_m * (3.0 - 4.0 * sin_m * sin_m)
+    c = (1.914602 - 0.004817 * t - 0.000014 * t * t) * sin_m
+    c += (0.019993 - 0.000101 * t) * sin_2m
+    c += 0.000289 * sin_3m
+
+    # Sun's true longitude and obliquity of the ecliptic (radians)
+    sun_lon_rad = (l0 + c) * DEG2RAD
+    epsilon_rad = (
+        23.439291 - 0.0130042 * t - 1.64e-7 * t * t + 5.04e-7 * t * t * t
+    ) * DEG2RAD
+
+    # Unit length by construction, as in compute_sun_vector_eci
+    sin_lon = np.sin(sun_lon_rad)
+    return np.stack(
+        (np.cos(sun_lon_rad), sin_lon * np.cos(epsilon_rad), sin_lon * np.sin(epsilon_rad)),
+        axis=-1,
+    )
 
 
 def compute_orbit_normal_eci(inclination_deg: float, raan_deg: float) -> tuple[float, float, float]:
@@ -77,6 +134,9 @@ def compute_orbit_normal_eci(inclination_deg: float, raan_deg: float) -> tuple[f
     For an orbit with inclination i and RAAN Ω:
     h_hat = (sin(i)*sin(Ω), -sin(i)*cos(Ω), cos(i))
     
+    Results are cached on the angles rounded to 1e-6 degrees; the returned
+    tuple is shared between callers and must be treated as read-only.
+
     Args:
         inclination_deg: Orbital inclination in degrees (0-180)
         raan_deg: Right Ascension of Ascending Node in degrees (0-360)
@@ -84,8 +144,17 @@ def compute_orbit_normal_eci(inclination_deg: float, raan_deg: float) -> tuple[f
     Returns:
         Tuple of (x, y, z) unit vector components in ECI frame
     """
-    i_rad = math.radians(inclination_deg)
-    raan_rad = math.radians(raan_deg)
+    return _orbit_normal_eci(
+        round(inclination_deg, _ORBIT_NORMAL_CACHE_DECIMALS),
+        round(raan_deg, _ORBIT_NORMAL_CACHE_DECIMALS),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _orbit_normal_eci(inclination_deg: float, raan_deg: float) -> tuple[float, float, float]:
+    """Cached body of compute_orbit_normal_eci."""
+    i_rad = inclination_deg * DEG2RAD
+    raan_rad = raan_deg * DEG2RAD
     
     sin_i = math.sin(i_rad)
     cos_i = math.cos(i_rad)
@@ -100,7 +169,7 @@ def compute_orbit_normal_eci(inclination_deg: float, raan_deg: float) -> tuple[f
     return (hx, hy, hz)
 
 
-def compute_beta_angle_deg(
+def compute_beta_angle_rad(
     dt: datetime, h_hat: tuple[float, float, float]
 ) -> float:
     """
@@ -118,7 +187,7 @@ def compute_beta_angle_deg(
         h_hat: Orbit normal unit vector in ECI frame
         
     Returns:
-        Beta angle in degrees (-90 to +90)
+        Beta angle in radians (-pi/2 to +pi/2)
     """
     sun_hat = compute_sun_vector_eci(dt)
     
@@ -129,6 +198,26 @@ def compute_beta_angle_deg(
     dot = max(-1.0, min(1.0, dot))
     
     # Beta angle
-    beta_rad = math.asin(dot)
+    return math.asin(dot)
+
+
+def compute_beta_angles_rad(
+    jd: npt.NDArray[np.float64], h_hat: tuple[float, float, float]
+) -> npt.NDArray[np.float64]:
+    """
+    Compute beta angles for an array of Julian days.
+
+    Vectorized form of compute_beta_angle_rad for a fixed orbit normal.
+
+    Args:
+        jd: Array of Julian Day Numbers, shape (N,)
+        h_hat: Orbit normal unit vector in ECI frame
+
+    Returns:
+        Array of beta angles in radians (-pi/2 to +pi/2), shape (N,)
+    """
+    sun_hat = compute_sun_vectors_eci(jd)
+
+    dot = sun_hat @ np.asarray(h_hat, dtype=np.float64)
     
-    return math.degrees(beta_rad)
+    return np.arcsin(np.clip(dot, -1.0, 1.0))
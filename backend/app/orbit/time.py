@@ -1,6 +1,12 @@
 """Time conversion utilities."""
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+# Time constants
+UNIX_EPOCH_JD = 2440587.5  # Julian Day of 1970-01-01T00:00:00Z
+SECONDS_PER_DAY = 86400.0
 
 
 def parse_iso8601(iso_string: str) -> datetime:
@@ -25,7 +31,7 @@ def parse_iso8601(iso_string: str) -> datetime:
     
     # Ensure timezone awareness
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        dt = dt.replace(tzinfo=UTC)
     
     return dt
 
@@ -45,7 +51,7 @@ def datetime_to_julian_day(dt: datetime) -> float:
     # Ensure we're working with UTC
     if dt.tzinfo is not None:
         # Convert to UTC timestamp
-        utc_dt = dt.astimezone(timezone.utc)
+        utc_dt = dt.astimezone(UTC)
     else:
         utc_dt = dt
     
@@ -75,6 +81,27 @@ def datetime_to_julian_day(dt: datetime) -> float:
     return jd
 
 
+def datetime_to_julian_day_fast(dt: datetime) -> float:
+    """
+    Convert datetime to Julian Day Number via its Unix timestamp.
+
+    JD = 2440587.5 + seconds_since_unix_epoch / 86400
+
+    Equivalent to datetime_to_julian_day for Gregorian dates, without the
+    calendar arithmetic. Naive datetimes are treated as UTC.
+
+    Args:
+        dt: Datetime object (should be UTC for astronomical calculations)
+
+    Returns:
+        Julian Day Number as float
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+
+    return UNIX_EPOCH_JD + dt.timestamp() / SECONDS_PER_DAY
+
+
 def julian_day_to_datetime(jd: float) -> datetime:
     """
     Convert Julian Day Number to datetime.
@@ -124,4 +151,37 @@ def julian_day_to_datetime(jd: float) -> datetime:
     second = int(seconds)
     microsecond = int((seconds - second) * 1000000)
     
-    return datetime(year, month, day_int, hour, minute, second, microsecond, tzinfo=timezone.utc)
+    return datetime(year, month, day_int, hour, minute, second, microsecond, tzinfo=UTC)
+
+
+def format_utc_timestamps(start_dt: datetime, step: timedelta, count: int) -> list[str]:
+    """
+    Format a uniformly spaced series of UTC timestamps as ISO8601 strings.
+
+    Equivalent to formatting start_dt + i * step for i in range(count) with a
+    'Z' suffix, but done in bulk with NumPy datetime64 arithmetic.
+    Fractional seconds are included only when the start or step is not a
+    whole number of seconds.
+
+    Args:
+        start_dt: First timestamp (naive datetimes are treated as UTC)
+        step: Spacing between timestamps
+        count: Number of timestamps
+
+    Returns:
+        List of ISO8601 strings, e.g. '2026-01-01T00:00:00Z'
+    """
+    if start_dt.tzinfo is not None:
+        start_dt = start_dt.astimezone(UTC).replace(tzinfo=None)
+
+    step_us = step // timedelta(microseconds=1)
+    times = np.datetime64(start_dt, "us") + np.arange(count, dtype=np.int64) * np.timedelta64(
+        step_us, "us"
+    )
+
+    whole_seconds = start_dt.microsecond == 0 and step_us % 1_000_000 == 0
+    timestamps: list[str] = np.datetime_as_string(
+        times, unit="s" if whole_seconds else "us", timezone="UTC"
+    ).tolist()
+
+    return timestamps
@@ -0,0 +1,12 @@
+import numpy as np
+import numpy.typing as npt
+
+def yearly_kernel(
+    jd: npt.NDArray[np.float64],
+    hx: float,
+    hy: float,
+    hz: float,
+    r_km: float,
+    re_km: float,
+    mu: float,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]: ...
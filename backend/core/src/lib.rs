@@ -0,0 +1,106 @@
+//! Compiled yearly eclipse kernel.
+//!
+//! Mirrors `app.orbit._kernels.yearly_kernel`: the sun vector, beta angle and
+//! eclipse duration for every Julian day are computed in one rayon parallel
+//! loop with the GIL released.
+
+use numpy::{IntoPyArray, PyArray1, PyReadonlyArray1};
+use pyo3::prelude::*;
+use rayon::prelude::*;
+
+const DEG2RAD: f64 = std::f64::consts::PI / 180.0;
+const J2000_JD: f64 = 2451545.0;
+const DAYS_PER_CENTURY: f64 = 36525.0;
+
+/// Below this many samples the serial loop beats rayon's scheduling overhead
+/// (same cutoff as `app.orbit._kernels.PARALLEL_MIN_SAMPLES`).
+const PARALLEL_MIN_SAMPLES: usize = 200;
+
+/// Radius-dependent terms shared by every sample.
+struct OrbitGeometry {
+    h_hat: [f64; 3],
+    r_km: f64,
+    shadow_h_km: f64,
+    mean_motion: f64,
+    sin_beta_crit: f64,
+}
+
+/// Approximate Sun unit vector in ECI frame (see `compute_sun_vector_eci`).
+fn sun_vector_eci(jd: f64) -> [f64; 3] {
+    let t = (jd - J2000_JD) / DAYS_PER_CENTURY;
+    let l0 = (280.46646 + 36000.76983 * t + 0.0003032 * t * t).rem_euclid(360.0);
+    let m = (357.52911 + 35999.05029 * t - 0.0001537 * t * t).rem_euclid(360.0);
+
+    let (sin_m, cos_m) = (m * DEG2RAD).sin_cos();
+    let sin_2m = 2.0 * sin_m * cos_m;
+    let sin_3m = sin_m * (3.0 - 4.0 * sin_m * sin_m);
+    let c = (1.914602 - 0.004817 * t - 0.000014 * t * t) * sin_m
+        + (0.019993 - 0.000101 * t) * sin_2m
+        + 0.000289 * sin_3m;
+
+    let sun_lon_rad = (l0 + c) * DEG2RAD;
+    let epsilon_rad =
+        (23.439291 - 0.0130042 * t - 1.64e-7 * t * t + 5.04e-7 * t * t * t) * DEG2RAD;
+
+    let (sin_lon, cos_lon) = sun_lon_rad.sin_cos();
+    let (sin_eps, cos_eps) = epsilon_rad.sin_cos();
+
+    // Unit length by construction
+    [cos_lon, sin_lon * cos_eps, sin_lon * sin_eps]
+}
+
+/// Beta angle (radians) and eclipse duration (seconds) at one Julian day.
+fn sample(jd: f64, geom: &OrbitGeometry) -> (f64, f64) {
+    let s = sun_vector_eci(jd);
+    let dot = (s[0] * geom.h_hat[0] + s[1] * geom.h_hat[1] + s[2] * geom.h_hat[2])
+        .clamp(-1.0, 1.0);
+
+    // dot = sin(beta), so the beta_crit test and cos(beta) need no further trig calls
+    let eclipse = if dot.abs() >= geom.sin_beta_crit {
+        0.0
+    } else {
+        let cos_theta_e = geom.shadow_h_km / (geom.r_km * (1.0 - dot * dot).sqrt());
+        2.0 * cos_theta_e.min(1.0).acos() / geom.mean_motion
+    };
+
+    (dot.asin(), eclipse)
+}
+
+/// Compute beta angles (radians) and eclipse durations (seconds) for an array of Julian days.
+#[pyfunction]
+#[allow(clippy::too_many_arguments)]
+fn yearly_kernel<'py>(
+    py: Python<'py>,
+    jd: PyReadonlyArray1<'py, f64>,
+    hx: f64,
+    hy: f64,
+    hz: f64,
+    r_km: f64,
+    re_km: f64,
+    mu: f64,
+) -> PyResult<(Bound<'py, PyArray1<f64>>, Bound<'py, PyArray1<f64>>)> {
+    let jd = jd.as_slice()?;
+    let geom = OrbitGeometry {
+        h_hat: [hx, hy, hz],
+        r_km,
+        shadow_h_km: (r_km * r_km - re_km * re_km).sqrt(),
+        mean_motion: (mu / r_km.powi(3)).sqrt(),
+        sin_beta_crit: re_km / r_km,
+    };
+
+    let (beta_rad, eclipse_sec): (Vec<f64>, Vec<f64>) = py.allow_threads(|| {
+        if jd.len() < PARALLEL_MIN_SAMPLES {
+            jd.iter().map(|&jd_i| sample(jd_i, &geom)).unzip()
+        } else {
+            jd.par_iter().map(|&jd_i| sample(jd_i, &geom)).unzip()
+        }
+    });
+
+    Ok((beta_rad.into_pyarray(py), eclipse_sec.into_pyarray(py)))
+}
+
+#[pymodule]
+fn sat_orbit_eclipse_core(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(yearly_kernel, m)?)?;
+    Ok(())
+}
@@ -0,0 +1,67 @@
+"""Tests for the compiled yearly eclipse kernels."""
+
+from datetime import UTC, datetime
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from app.orbit import _kernels
+from app.orbit.eclipse import EARTH_MU, EARTH_RADIUS_KM, compute_orbit_radius_km, make_eclipse_fn
+from app.orbit.sun import compute_beta_angles_rad, compute_orbit_normal_eci
+from app.orbit.time import datetime_to_julian_day
+
+# (altitude km, inclination deg, RAAN deg): ISS-like LEO, a sun-synchronous orbit that
+# spends months above beta_crit, a polar orbit and GEO (eclipse-free outside the equinoxes)
+ORBITS = [
+    (400.0, 51.6, 0.0),
+    (800.0, 98.6, 270.0),
+    (550.0, 90.0, 120.0),
+    (35786.0, 0.0, 0.0),
+]
+
+# Hourly samples over a year, plus batches on both sides of PARALLEL_MIN_SAMPLES
+SAMPLE_COUNTS = [
+    1,
+    _kernels.PARALLEL_MIN_SAMPLES - 1,
+    _kernels.PARALLEL_MIN_SAMPLES,
+    365 * 24 + 1,
+]
+
+
+def _julian_days(count: int) -> npt.NDArray[np.float64]:
+    jd0 = datetime_to_julian_day(datetime(2026, 1, 1, tzinfo=UTC))
+    return jd0 + np.arange(count, dtype=np.float64) * (365.0 / max(count - 1, 1))
+
+
+def _check_against_numpy(kernel_name: str, orbit: tuple[float, float, float], count: int) -> None:
+    altitude_km, inclination_deg, raan_deg = orbit
+    r_km = compute_orbit_radius_km(altitude_km)
+    h_hat = compute_orbit_normal_eci(inclination_deg, raan_deg)
+    jd = _julian_days(count)
+
+    kernel = getattr(_kernels, kernel_name)
+    beta_rad, eclipse_sec = kernel(jd, *h_hat, r_km, EARTH_RADIUS_KM, EARTH_MU)
+
+    expected_beta_rad = compute_beta_angles_rad(jd, h_hat)
+    expected_eclipse_sec = make_eclipse_fn(r_km)(expected_beta_rad)
+
+    np.testing.assert_allclose(beta_rad, expected_beta_rad, rtol=0.0, atol=1e-10)
+    # Eclipse time is steep in beta near beta_crit; 1e-4 s is far below the reported 1e-4 min
+    np.testing.assert_allclose(eclipse_sec, expected_eclipse_sec, rtol=0.0, atol=1e-4)
+
+
+@pytest.mark.parametrize("count", SAMPLE_COUNTS)
+@pytest.mark.parametrize("orbit", ORBITS)
+def test_numba_kernel_matches_numpy(orbit: tuple[float, float, float], count: int) -> None:
+    pytest.importorskip("numba")
+
+    _check_against_numpy("numba_yearly_kernel", orbit, count)
+
+
+@pytest.mark.parametrize("count", SAMPLE_COUNTS)
+@pytest.mark.parametrize("orbit", ORBITS)
+def test_rust_kernel_matches_numpy(orbit: tuple[float, float, float], count: int) -> None:
+    pytest.importorskip("sat_orbit_eclipse_core")
+
+    _check_against_numpy("rust_yearly_kernel", orbit, count)
@@ -0,0 +1,30 @@
+"""Tests for the Sun position model."""
+
+import math
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from app.orbit.sun import compute_sun_vector_eci, compute_sun_vectors_eci
+from app.orbit.time import datetime_to_julian_day
+
+# The Sun vector is unit length by construction, so no normalization is applied;
+# these tests guard that identity against future edits to the model.
+START = datetime(2026, 1, 1, tzinfo=UTC)
+HOURS_PER_YEAR = 365 * 24
+
+
+def test_sun_vectors_are_unit_length_over_a_year() -> None:
+    jd0 = datetime_to_julian_day(START)
+    jd = jd0 + np.arange(HOURS_PER_YEAR + 1, dtype=np.float64) / 24.0
+
+    norms = np.linalg.norm(compute_sun_vectors_eci(jd), axis=1)
+
+    assert np.max(np.abs(norms - 1.0)) < 1e-12
+
+
+def test_sun_vector_is_unit_length_over_a_year() -> None:
+    for hour in range(HOURS_PER_YEAR + 1):
+        x, y, z = compute_sun_vector_eci(START + timedelta(hours=hour))
+
+        assert abs(math.sqrt(x * x + y * y + z * z) - 1.0) < 1e-12